@@ -9,9 +9,209 @@ Results are saved to StatisticsResults.txt and displayed on screen.
 Usage: python compute_statistics.py <file_path>
 """
 
+import mmap
+import os
+import re
 import sys
 import time
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to pure Python
+    _HAVE_NUMBA = False
+    prange = range  # pylint: disable=invalid-name
+
+    def njit(*args, **_kwargs):
+        """Fallback no-op decorator when numba is not installed."""
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+# Below this size the JIT warmup and thread startup of the parallel
+# kernel cost more than the single-threaded pass saves
+_PARALLEL_THRESHOLD = 10_000_000
+
+
+@njit(cache=True)
+def _mean_var_welford(arr):
+    """
+    Compute mean and population variance in a single pass.
+
+    Uses Welford's online algorithm, which is numerically stable and
+    needs O(1) extra memory instead of an n-sized list of squared
+    deviations. JIT-compiled with numba when available.
+
+    Args:
+        arr (numpy.ndarray): Array of float64 values (must be non-empty)
+
+    Returns:
+        tuple: (mean, variance)
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in arr:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+    return mean, m2 / count
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _parallel_welford(arr, nchunks):  # pylint: disable=too-many-locals
+    """
+    Parallel mean/variance for huge arrays.
+
+    Runs one Welford accumulator per chunk in parallel threads, then
+    merges the per-chunk (count, mean, m2) partials with Chan's
+    formula. Only worth it above _PARALLEL_THRESHOLD elements.
+
+    Args:
+        arr (numpy.ndarray): Array of float64 values (must be non-empty)
+        nchunks (int): Number of parallel chunks
+
+    Returns:
+        tuple: (mean, variance)
+    """
+    counts = np.zeros(nchunks, dtype=np.int64)
+    means = np.zeros(nchunks)
+    m2s = np.zeros(nchunks)
+    chunk = (arr.size + nchunks - 1) // nchunks
+
+    for i in prange(nchunks):  # pylint: disable=not-an-iterable
+        start = i * chunk
+        end = min(start + chunk, arr.size)
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for j in range(start, end):
+            x = arr[j]
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        counts[i] = count
+        means[i] = mean
+        m2s[i] = m2
+
+    # Merge the per-chunk partials (Chan's parallel formula)
+    count = counts[0]
+    mean = means[0]
+    m2 = m2s[0]
+    for i in range(1, nchunks):
+        if counts[i] == 0:
+            continue
+        delta = means[i] - mean
+        total = count + counts[i]
+        m2 = m2 + m2s[i] + delta * delta * count * counts[i] / total
+        mean = mean + delta * counts[i] / total
+        count = total
+
+    return mean, m2 / count
+
+
+def _mean_and_variance(arr):
+    """
+    Dispatch mean/variance to the serial or parallel Welford kernel.
+
+    Args:
+        arr (numpy.ndarray): Array of float64 values (must be non-empty)
+
+    Returns:
+        tuple: (mean, variance)
+    """
+    if _HAVE_NUMBA and arr.size > _PARALLEL_THRESHOLD:
+        return _parallel_welford(arr, os.cpu_count() or 1)
+    return _mean_var_welford(arr)
+
+
+class Dataset:
+    """
+    Lightweight wrapper caching the float64 view of a number sequence.
+
+    Repeated statistic queries (mean, then variance, then std) reuse
+    the same ndarray instead of re-paying the conversion on each call.
+    """
+
+    def __init__(self, numbers):
+        self._numbers = numbers
+        self._arr = None
+
+    def __len__(self):
+        return len(self._numbers)
+
+    @property
+    def arr(self):
+        """Lazily built float64 ndarray of the wrapped numbers."""
+        if self._arr is None:
+            self._arr = np.asarray(self._numbers, dtype=np.float64)
+        return self._arr
+
+
+def _as_array(numbers):
+    """
+    Convert a sequence of numbers to a float64 ndarray.
+
+    Reuses the cached array of a Dataset, or the input buffer when it
+    is already a float64 ndarray, so the conversion cost is paid only
+    once per dataset.
+
+    Args:
+        numbers (Dataset, list or numpy.ndarray): Sequence of numbers
+
+    Returns:
+        numpy.ndarray: Array of float64 values
+    """
+    if isinstance(numbers, Dataset):
+        return numbers.arr
+    if isinstance(numbers, np.ndarray) and numbers.dtype == np.float64:
+        return numbers
+    return np.asarray(numbers, dtype=np.float64)
+
+
+def _parse_mapped_file(file_path):
+    """
+    Parse a whole file of numbers through a memory map.
+
+    Feeds np.genfromtxt lines straight off the mmap'ed buffer, so the
+    kernel pages data in on demand and the file bytes are never copied
+    into an intermediate Python object.
+
+    Args:
+        file_path (str): Path to the input file
+
+    Returns:
+        numpy.ndarray or None: Parsed float64 array, or None when the
+            file is empty or contains invalid lines and the caller must
+            fall back to the per-line loop that reports warnings
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if re.search(rb'\S', buf) is None:
+                # Whitespace only: genfromtxt would warn about an empty
+                # input instead of parsing anything
+                return np.empty(0, dtype=np.float64)
+            try:
+                arr = np.genfromtxt(iter(buf.readline, b''),
+                                    dtype=np.float64, comments=None)
+            except ValueError:
+                return None
+
+    arr = np.atleast_1d(arr)
+    # genfromtxt marks unparseable lines as nan instead of raising
+    if arr.ndim != 1 or np.isnan(arr).any():
+        return None
+    return arr
+
 
 def read_numbers_from_file(file_path):
     """
@@ -24,9 +224,16 @@ def read_numbers_from_file(file_path):
         list: List of valid numbers (float)
     """
     numbers = []
-    invalid_count = 0
+    warnings = []
 
     try:
+        # Fast path: mmap the file and parse it in C. Falls back to the
+        # per-line loop when any line is not a valid number so the
+        # invalid-data warnings are preserved.
+        arr = _parse_mapped_file(file_path)
+        if arr is not None:
+            return arr.tolist()
+
         with open(file_path, 'r', encoding='utf-8') as file:
             for line_num, line in enumerate(file, 1):
                 line = line.strip()
@@ -35,12 +242,15 @@ def read_numbers_from_file(file_path):
                         number = float(line)
                         numbers.append(number)
                     except ValueError:
-                        print(f"Warning: Invalid data on line {line_num}: "
-                              f"'{line}' (skipped)")
-                        invalid_count += 1
+                        warnings.append(
+                            f"Warning: Invalid data on line {line_num}: "
+                            f"'{line}' (skipped)")
 
-        if invalid_count > 0:
-            print(f"\nTotal invalid entries skipped: {invalid_count}\n")
+        if warnings:
+            # One write instead of one syscall per invalid line
+            warnings.append(
+                f"\nTotal invalid entries skipped: {len(warnings)}\n")
+            sys.stderr.write('\n'.join(warnings) + '\n')
 
         return numbers
 
@@ -62,9 +272,9 @@ def calculate_mean(numbers):
     Returns:
         float: Mean value
     """
-    if not numbers:
+    if len(numbers) == 0:
         return 0.0
-    return sum(numbers) / len(numbers)
+    return float(_as_array(numbers).mean())
 
 
 def calculate_median(numbers):
@@ -77,18 +287,19 @@ def calculate_median(numbers):
     Returns:
         float: Median value
     """
-    if not numbers:
+    if len(numbers) == 0:
         return 0.0
 
-    sorted_numbers = sorted(numbers)
-    n = len(sorted_numbers)
+    arr = _as_array(numbers)
+    n = len(arr)
     mid = n // 2
 
     if n % 2 == 0:  # Even number of elements
-        return (sorted_numbers[mid - 1] + sorted_numbers[mid]) / 2
+        partitioned = np.partition(arr, [mid - 1, mid])
+        return float((partitioned[mid - 1] + partitioned[mid]) / 2)
 
-    # Odd number of elements
-    return sorted_numbers[mid]
+    # Odd number of elements; np.partition is O(n) vs O(n log n) sort
+    return float(np.partition(arr, mid)[mid])
 
 
 def calculate_mode(numbers):
@@ -101,25 +312,13 @@ def calculate_mode(numbers):
     Returns:
         float: Mode value (returns first mode if multiple exist)
     """
-    if not numbers:
+    if len(numbers) == 0:
         return 0.0
 
-    # Count frequencies manually
-    frequency = {}
-    for num in numbers:
-        if num in frequency:
-            frequency[num] += 1
-        else:
-            frequency[num] = 1
-
-    # Find maximum frequency
-    max_freq = max(frequency.values())
-
-    # Find the number(s) with maximum frequency
-    modes = [num for num, freq in frequency.items() if freq == max_freq]
-
-    # Return the first mode (or smallest if multiple)
-    return min(modes) if modes else 0.0
+    # np.unique returns values in ascending order, so the first index
+    # with the maximum count is automatically the smallest mode
+    values, counts = np.unique(_as_array(numbers), return_counts=True)
+    return float(values[counts.argmax()])
 
 
 def calculate_variance(numbers):
@@ -132,14 +331,9 @@ def calculate_variance(numbers):
     Returns:
         float: Population variance
     """
-    if not numbers:
+    if len(numbers) == 0:
         return 0.0
-
-    mean = calculate_mean(numbers)
-    squared_diffs = [(x - mean) ** 2 for x in numbers]
-    variance = sum(squared_diffs) / len(numbers)
-
-    return variance
+    return float(_mean_and_variance(_as_array(numbers))[1])
 
 
 def calculate_std_deviation(numbers):
@@ -152,11 +346,43 @@ def calculate_std_deviation(numbers):
     Returns:
         float: Population standard deviation
     """
-    if not numbers:
+    if len(numbers) == 0:
         return 0.0
+    return float(_mean_and_variance(_as_array(numbers))[1]) ** 0.5
+
+
+def compute_all_stats(numbers):
+    """
+    Compute all statistics over one shared array.
+
+    Builds the float64 array once and reuses it for every statistic:
+    one Welford pass for mean/variance/std, one np.partition for the
+    median and one np.unique for the mode, instead of re-walking the
+    data per metric.
 
-    variance = calculate_variance(numbers)
-    return variance ** 0.5
+    Args:
+        numbers (list or numpy.ndarray): Sequence of numbers
+
+    Returns:
+        dict: Statistics with keys count, mean, median, mode,
+            std_dev and variance
+    """
+    arr = _as_array(numbers)
+    count = len(arr)
+
+    if count == 0:
+        return {'count': 0, 'mean': 0.0, 'median': 0.0, 'mode': 0.0,
+                'std_dev': 0.0, 'variance': 0.0}
+
+    mean, variance = _mean_and_variance(arr)
+    return {
+        'count': count,
+        'mean': float(mean),
+        'median': calculate_median(arr),
+        'mode': calculate_mode(arr),
+        'std_dev': float(variance) ** 0.5,
+        'variance': float(variance),
+    }
 
 
 def format_results(stats):
@@ -230,28 +456,14 @@ def main():
         print("Error: No valid numbers found in the file.")
         sys.exit(1)
 
-    # Calculate statistics
-    count = len(numbers)
-    mean = calculate_mean(numbers)
-    median = calculate_median(numbers)
-    mode = calculate_mode(numbers)
-    std_dev = calculate_std_deviation(numbers)
-    variance = calculate_variance(numbers)
+    # Calculate all statistics from one shared array
+    stats = compute_all_stats(Dataset(numbers))
 
     # End timing
     end_time = time.time()
-    elapsed_time = end_time - start_time
+    stats['elapsed_time'] = end_time - start_time
 
     # Format and display results
-    stats = {
-        'count': count,
-        'mean': mean,
-        'median': median,
-        'mode': mode,
-        'std_dev': std_dev,
-        'variance': variance,
-        'elapsed_time': elapsed_time
-    }
     results_text = format_results(stats)
 
     print(results_text)
@@ -3,6 +3,7 @@
 import sys
 import os
 import tempfile
+import numpy as np
 import pytest
 
 # Add source directory to path
@@ -11,14 +12,33 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
 # pylint: disable=wrong-import-position
 import compute_statistics as cs
 
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# Shared ndarray inputs, built once for the whole module; also
+# exercises the ndarray path the calculators use in main
+_FIVE = np.array([1, 2, 3, 4, 5], np.float64)
+_ALL_FIVES = np.array([5, 5, 5, 5], np.float64)
+_KNOWN = np.array([2, 4, 4, 4, 5, 5, 7, 9], np.float64)
+
+
+@pytest.fixture(scope='module')
+def tc1_numbers():
+    """Read TC1.txt once for all integration tests in this module"""
+    return cs.read_numbers_from_file(os.path.join(DATA_DIR, 'TC1.txt'))
+
+
+@pytest.fixture(scope='module')
+def tc5_numbers():
+    """Read TC5.txt once for all integration tests in this module"""
+    return cs.read_numbers_from_file(os.path.join(DATA_DIR, 'TC5.txt'))
+
 
 class TestCalculateMean:
     """Tests for calculate_mean function"""
 
     def test_mean_positive_numbers(self):
         """Test mean with positive numbers"""
-        numbers = [1, 2, 3, 4, 5]
-        assert cs.calculate_mean(numbers) == 3.0
+        assert cs.calculate_mean(_FIVE) == 3.0
 
     def test_mean_negative_numbers(self):
         """Test mean with negative numbers"""
@@ -44,8 +64,7 @@ class TestCalculateMedian:
 
     def test_median_odd_count(self):
         """Test median with odd number of elements"""
-        numbers = [1, 2, 3, 4, 5]
-        assert cs.calculate_median(numbers) == 3
+        assert cs.calculate_median(_FIVE) == 3
 
     def test_median_even_count(self):
         """Test median with even number of elements"""
@@ -76,8 +95,7 @@ class TestCalculateMode:
 
     def test_mode_all_same(self):
         """Test mode when all numbers are the same"""
-        numbers = [5, 5, 5, 5]
-        assert cs.calculate_mode(numbers) == 5
+        assert cs.calculate_mode(_ALL_FIVES) == 5
 
     def test_mode_multiple_modes(self):
         """Test mode with multiple modes (returns minimum)"""
@@ -98,14 +116,12 @@ class TestCalculateVariance:
 
     def test_variance_known_values(self):
         """Test variance with known result"""
-        numbers = [2, 4, 4, 4, 5, 5, 7, 9]
-        variance = cs.calculate_variance(numbers)
+        variance = cs.calculate_variance(_KNOWN)
         assert abs(variance - 4.0) < 0.01  # Expected variance is 4.0
 
     def test_variance_all_same(self):
         """Test variance when all values are the same"""
-        numbers = [5, 5, 5, 5]
-        assert cs.calculate_variance(numbers) == 0.0
+        assert cs.calculate_variance(_ALL_FIVES) == 0.0
 
     def test_variance_empty_list(self):
         """Test variance with empty list"""
@@ -117,20 +133,64 @@ class TestCalculateStdDeviation:
 
     def test_std_dev_known_values(self):
         """Test standard deviation with known result"""
-        numbers = [2, 4, 4, 4, 5, 5, 7, 9]
-        std_dev = cs.calculate_std_deviation(numbers)
+        std_dev = cs.calculate_std_deviation(_KNOWN)
         assert abs(std_dev - 2.0) < 0.01  # Expected std dev is 2.0
 
     def test_std_dev_all_same(self):
         """Test std dev when all values are the same"""
-        numbers = [5, 5, 5, 5]
-        assert cs.calculate_std_deviation(numbers) == 0.0
+        assert cs.calculate_std_deviation(_ALL_FIVES) == 0.0
 
     def test_std_dev_empty_list(self):
         """Test std dev with empty list"""
         assert cs.calculate_std_deviation([]) == 0.0
 
 
+class TestComputeAllStats:
+    """Tests for compute_all_stats function"""
+
+    def test_all_stats_known_values(self):
+        """Test all statistics against the per-function calculators"""
+        stats = cs.compute_all_stats(_KNOWN)
+
+        assert stats['count'] == len(_KNOWN)
+        assert stats['mean'] == cs.calculate_mean(_KNOWN)
+        assert stats['median'] == cs.calculate_median(_KNOWN)
+        assert stats['mode'] == cs.calculate_mode(_KNOWN)
+        assert abs(stats['variance'] - 4.0) < 0.01
+        assert abs(stats['std_dev'] - 2.0) < 0.01
+
+    def test_all_stats_empty_input(self):
+        """Test all statistics with empty input"""
+        stats = cs.compute_all_stats([])
+
+        assert stats == {'count': 0, 'mean': 0.0, 'median': 0.0,
+                         'mode': 0.0, 'std_dev': 0.0, 'variance': 0.0}
+
+    def test_all_stats_accepts_dataset(self):
+        """Test that a Dataset wrapper gives the same results as a list"""
+        numbers = [1, 2, 3, 4, 5]
+        assert cs.compute_all_stats(cs.Dataset(numbers)) == \
+            cs.compute_all_stats(numbers)
+
+
+class TestDataset:
+    """Tests for the Dataset wrapper"""
+
+    def test_len_matches_input(self):
+        """Test that len() reflects the wrapped sequence"""
+        assert len(cs.Dataset([1, 2, 3])) == 3
+
+    def test_arr_is_float64(self):
+        """Test that the array view is float64"""
+        dataset = cs.Dataset([1, 2, 3])
+        assert dataset.arr.dtype == np.float64
+
+    def test_arr_is_cached(self):
+        """Test that repeated accesses reuse the same array"""
+        dataset = cs.Dataset([1, 2, 3])
+        assert dataset.arr is dataset.arr
+
+
 class TestReadNumbersFromFile:
     """Tests for read_numbers_from_file function"""
 
@@ -180,12 +240,9 @@ class TestReadNumbersFromFile:
 class TestIntegrationTC1:
     """Integration test with TC1.txt"""
 
-    def test_tc1_statistics(self):
+    def test_tc1_statistics(self, tc1_numbers):
         """Test statistics calculation with TC1.txt"""
-        test_file = os.path.join(
-            os.path.dirname(__file__), 'data', 'TC1.txt'
-        )
-        numbers = cs.read_numbers_from_file(test_file)
+        numbers = tc1_numbers
 
         # Verify count
         assert len(numbers) == 400
@@ -208,12 +265,9 @@ class TestIntegrationTC1:
 class TestIntegrationTC5:
     """Integration test with TC5.txt (has invalid data)"""
 
-    def test_tc5_with_invalid_data(self):
+    def test_tc5_with_invalid_data(self, tc5_numbers):
         """Test handling of invalid data in TC5.txt"""
-        test_file = os.path.join(
-            os.path.dirname(__file__), 'data', 'TC5.txt'
-        )
-        numbers = cs.read_numbers_from_file(test_file)
+        numbers = tc5_numbers
 
         # TC5 has 311 total lines but 4 invalid entries
         assert len(numbers) == 307
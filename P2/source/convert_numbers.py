@@ -11,6 +11,21 @@ Usage: python convert_numbers.py <file_path>
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+
+# When True the scalar converters delegate to CPython's C-implemented
+# bin()/format(); set to False to run the manual digit loops instead
+_FAST = True
+
+# Hex digit table shared by the scalar converter, built once at import
+_HEX_TABLE = b'0123456789ABCDEF'
+
+# Digit lookup tables shared by the batched converters
+_BIN_CHARS = np.frombuffer(b'01', dtype='S1')
+_HEX_CHARS = np.frombuffer(_HEX_TABLE, dtype='S1')
 
 
 def read_numbers_from_file(file_path):
@@ -24,28 +39,47 @@ def read_numbers_from_file(file_path):
         list: List of valid integers
     """
     numbers = []
-    invalid_count = 0
+    warnings = []
 
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
+            try:
+                # Fast path: parse the whole file in C. Falls back to
+                # the per-line loop when a line is not a valid integer
+                # or negatives are present, so warnings are preserved.
+                # loadtxt warns instead of raising on empty input; keep
+                # that numpy noise away from the user.
+                with catch_warnings():
+                    simplefilter('ignore')
+                    arr = np.loadtxt(file, dtype=np.int64,
+                                     comments=None, ndmin=1)
+                if arr.ndim == 1 and not (arr < 0).any():
+                    return arr.tolist()
+            except ValueError:
+                pass
+            file.seek(0)
+
             for line_num, line in enumerate(file, 1):
                 line = line.strip()
                 if line:  # Skip empty lines
                     try:
                         number = int(line)
                         if number < 0:
-                            print(f"Warning: Negative number on line "
-                                  f"{line_num}: {number} (skipped)")
-                            invalid_count += 1
+                            warnings.append(
+                                f"Warning: Negative number on line "
+                                f"{line_num}: {number} (skipped)")
                         else:
                             numbers.append(number)
                     except ValueError:
-                        print(f"Warning: Invalid data on line {line_num}: "
-                              f"'{line}' (skipped)")
-                        invalid_count += 1
+                        warnings.append(
+                            f"Warning: Invalid data on line {line_num}: "
+                            f"'{line}' (skipped)")
 
-        if invalid_count > 0:
-            print(f"\nTotal invalid entries skipped: {invalid_count}\n")
+        if warnings:
+            # One write instead of one syscall per invalid line
+            warnings.append(
+                f"\nTotal invalid entries skipped: {len(warnings)}\n")
+            sys.stderr.write('\n'.join(warnings) + '\n')
 
         return numbers
 
@@ -57,6 +91,46 @@ def read_numbers_from_file(file_path):
         sys.exit(1)
 
 
+def batch_to_binary(numbers):
+    """
+    Convert a whole sequence of numbers to binary representations.
+
+    Extracts all 64 bits of every number at once with vectorized
+    shifts and masks instead of looping per number in Python.
+
+    Args:
+        numbers (sequence): Numbers to convert (must be >= 0)
+
+    Returns:
+        list: Binary representation (str) of each number
+    """
+    arr = np.asarray(numbers, dtype=np.uint64)
+    shifts = np.arange(64, dtype=np.uint64)[::-1]
+    bits = (arr[:, None] >> shifts) & np.uint64(1)
+    rows = np.ascontiguousarray(_BIN_CHARS[bits]).view('S64').ravel()
+    return [row.decode('ascii').lstrip('0') or '0' for row in rows]
+
+
+def batch_to_hexadecimal(numbers):
+    """
+    Convert a whole sequence of numbers to hexadecimal representations.
+
+    Extracts all 16 nibbles of every number at once with vectorized
+    shifts and masks instead of looping per number in Python.
+
+    Args:
+        numbers (sequence): Numbers to convert (must be >= 0)
+
+    Returns:
+        list: Hexadecimal representation (str, uppercase) of each number
+    """
+    arr = np.asarray(numbers, dtype=np.uint64)
+    shifts = np.arange(16, dtype=np.uint64)[::-1] * np.uint64(4)
+    nibbles = (arr[:, None] >> shifts) & np.uint64(0xF)
+    rows = np.ascontiguousarray(_HEX_CHARS[nibbles]).view('S16').ravel()
+    return [row.decode('ascii').lstrip('0') or '0' for row in rows]
+
+
 def to_binary(number):
     """
     Convert a number to binary representation manually.
@@ -67,18 +141,23 @@ def to_binary(number):
     Returns:
         str: Binary representation
     """
+    if _FAST:
+        return bin(number)[2:]
+
     if number == 0:
         return '0'
 
-    binary = ''
+    # Fill a preallocated buffer right-to-left; prepending to a str
+    # inside the loop would copy the growing string each iteration
+    buf = bytearray(number.bit_length())
     temp = number
 
-    while temp > 0:
-        remainder = temp % 2
-        binary = str(remainder) + binary
-        temp = temp // 2
+    for i in range(len(buf) - 1, -1, -1):
+        # Shift and mask instead of divmod by a constant
+        buf[i] = 0x30 | (temp & 1)
+        temp >>= 1
 
-    return binary
+    return buf.decode('ascii')
 
 
 def to_hexadecimal(number):
@@ -91,19 +170,21 @@ def to_hexadecimal(number):
     Returns:
         str: Hexadecimal representation (uppercase)
     """
+    if _FAST:
+        return format(number, 'X')
+
     if number == 0:
         return '0'
 
-    hex_digits = '0123456789ABCDEF'
-    hexadecimal = ''
+    buf = bytearray((number.bit_length() + 3) // 4)
     temp = number
 
-    while temp > 0:
-        remainder = temp % 16
-        hexadecimal = hex_digits[remainder] + hexadecimal
-        temp = temp // 16
+    for i in range(len(buf) - 1, -1, -1):
+        # Shift and mask instead of divmod by a constant
+        buf[i] = _HEX_TABLE[temp & 0xF]
+        temp >>= 4
 
-    return hexadecimal
+    return buf.decode('ascii')
 
 
 def format_results(conversions, elapsed_time):
@@ -111,12 +192,22 @@ def format_results(conversions, elapsed_time):
     Format conversion results as a string.
 
     Args:
-        conversions (list): List of tuples (number, binary, hexadecimal)
+        conversions (list or tuple): Either a list of tuples
+            (number, binary, hexadecimal) or a 3-tuple of parallel
+            columns (numbers, binaries, hexadecimals)
         elapsed_time (float): Execution time in seconds
 
     Returns:
         str: Formatted results
     """
+    if isinstance(conversions, tuple):
+        numbers, binaries, hexadecimals = conversions
+    else:
+        numbers = [row[0] for row in conversions]
+        binaries = [row[1] for row in conversions]
+        hexadecimals = [row[2] for row in conversions]
+    total = len(numbers)
+
     results = []
     results.append("=" * 70)
     results.append("NUMBER BASE CONVERSION RESULTS")
@@ -124,11 +215,21 @@ def format_results(conversions, elapsed_time):
     results.append(f"{'NUMBER':<15} {'BINARY':<30} {'HEXADECIMAL':<15}")
     results.append("-" * 70)
 
-    for number, binary, hexadecimal in conversions:
-        results.append(f"{number:<15} {binary:<30} {hexadecimal:<15}")
+    if total:
+        # Pad the three columns in C over string arrays instead of
+        # allocating one f-string per row. str() per number keeps the
+        # full digits; a fixed-width 'U15' cast would truncate 16-digit
+        # and longer values, and ljust itself never truncates.
+        col_num = np.char.ljust(
+            np.asarray([str(number) for number in numbers]), 15)
+        col_bin = np.char.ljust(np.asarray(binaries, dtype='U'), 30)
+        col_hex = np.char.ljust(np.asarray(hexadecimals, dtype='U'), 15)
+        rows = np.char.add(np.char.add(col_num, ' '),
+                           np.char.add(np.char.add(col_bin, ' '), col_hex))
+        results.extend(rows.tolist())
 
     results.append("=" * 70)
-    results.append(f"Total conversions: {len(conversions)}")
+    results.append(f"Total conversions: {total}")
     results.append(f"Execution Time:    {elapsed_time:.6f} seconds")
     results.append("=" * 70)
 
@@ -172,12 +273,24 @@ def main():
         print("Error: No valid numbers found in the file.")
         sys.exit(1)
 
-    # Convert numbers
-    conversions = []
-    for number in numbers:
-        binary = to_binary(number)
-        hexadecimal = to_hexadecimal(number)
-        conversions.append((number, binary, hexadecimal))
+    # Convert all numbers in one batched pass per base; the two passes
+    # are independent NumPy calls that release the GIL, so run them on
+    # parallel threads
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            binary_future = executor.submit(batch_to_binary, numbers)
+            hex_future = executor.submit(batch_to_hexadecimal, numbers)
+            binaries = binary_future.result()
+            hexadecimals = hex_future.result()
+    except OverflowError:
+        # Values >= 2**64 do not fit the uint64 batch path; the scalar
+        # converters handle arbitrary Python ints
+        binaries = [to_binary(number) for number in numbers]
+        hexadecimals = [to_hexadecimal(number) for number in numbers]
+
+    # Keep the three columns as parallel arrays (SoA) instead of
+    # materializing one tuple per row
+    conversions = (numbers, binaries, hexadecimals)
 
     # End timing
     end_time = time.time()
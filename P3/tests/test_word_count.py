@@ -103,6 +103,82 @@ class TestCountWordFrequencies:
         assert freq == {}
 
 
+class TestCountWordsFromFile:
+    """Tests for count_words_from_file function"""
+
+    def test_count_ascii_file_uses_bytes_keys(self):
+        """Test that pure-ASCII input is counted with bytes keys"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("Hello world hello")
+            temp_file = f.name
+
+        try:
+            freq = wc.count_words_from_file(temp_file)
+            assert freq[b'hello'] == 2
+            assert freq[b'world'] == 1
+        finally:
+            os.unlink(temp_file)
+
+    def test_count_non_ascii_file_uses_str_keys(self):
+        """Test that non-ASCII input is counted with str keys"""
+        with tempfile.NamedTemporaryFile(
+                mode='w', delete=False, encoding='utf-8') as f:
+            f.write("Canción canción niño")
+            temp_file = f.name
+
+        try:
+            freq = wc.count_words_from_file(temp_file)
+            assert freq['canción'] == 2
+            assert freq['niño'] == 1
+        finally:
+            os.unlink(temp_file)
+
+    def test_count_splits_on_unicode_whitespace(self):
+        """Test that non-breaking spaces separate words like str.split"""
+        with tempfile.NamedTemporaryFile(
+                mode='w', delete=False, encoding='utf-8') as f:
+            f.write("café\xa0bar café")
+            temp_file = f.name
+
+        try:
+            freq = wc.count_words_from_file(temp_file)
+            assert freq == {'café': 2, 'bar': 1}
+        finally:
+            os.unlink(temp_file)
+
+    def test_count_matches_word_list_totals(self):
+        """Test parity with read_words_from_file plus manual counting"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("hello world\nhello python\nworld")
+            temp_file = f.name
+
+        try:
+            freq = wc.count_words_from_file(temp_file)
+            words = wc.read_words_from_file(temp_file)
+            expected = wc.count_word_frequencies(words)
+            decoded = {word.decode('utf-8'): count
+                       for word, count in freq.items()}
+            assert decoded == expected
+        finally:
+            os.unlink(temp_file)
+
+    def test_count_empty_file(self):
+        """Test counting an empty file"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            freq = wc.count_words_from_file(temp_file)
+            assert not freq
+        finally:
+            os.unlink(temp_file)
+
+    def test_count_nonexistent_file(self):
+        """Test counting non-existent file"""
+        with pytest.raises(SystemExit):
+            wc.count_words_from_file("nonexistent_file.txt")
+
+
 class TestSortFrequencyDict:
     """Tests for sort_frequency_dict function"""
 
@@ -135,6 +211,31 @@ class TestSortFrequencyDict:
         assert sorted_freq == []
 
 
+class TestSortFrequenciesColumns:
+    """Tests for sort_frequencies_columns function"""
+
+    def test_sort_columns_alphabetically(self):
+        """Test that both columns follow alphabetical word order"""
+        freq = {'zebra': 1, 'apple': 2, 'banana': 3}
+        words, counts = wc.sort_frequencies_columns(freq)
+
+        assert words == ['apple', 'banana', 'zebra']
+        assert counts == [2, 3, 1]
+
+    def test_sort_columns_match_tuple_sort(self):
+        """Test parity with sort_frequency_dict"""
+        freq = {'c': 3, 'a': 1, 'b': 2}
+        words, counts = wc.sort_frequencies_columns(freq)
+
+        assert list(zip(words, counts)) == wc.sort_frequency_dict(freq)
+
+    def test_sort_columns_empty_dict(self):
+        """Test sorting empty dictionary"""
+        words, counts = wc.sort_frequencies_columns({})
+        assert words == []
+        assert counts == []
+
+
 class TestIntegrationTC1:
     """Integration test with TC1.txt"""
 
@@ -202,6 +303,52 @@ class TestSaveResults:
                 assert content == test_content
 
 
+class TestWriteResults:
+    """Tests for write_results function"""
+
+    def test_write_results_matches_format_results(self):
+        """Test that the streamed report equals the formatted string"""
+        sorted_freq = [('apple', 3), ('banana', 1), ('cherry', 2)]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, 'test_word_count.txt')
+            wc.write_results(output_file, sorted_freq, 6, 0.123)
+
+            with open(output_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        expected = wc.format_results(sorted_freq, 6, 0.123)
+        assert content == expected + '\n'
+
+    def test_write_results_accepts_columns(self):
+        """Test the parallel-columns input main passes"""
+        columns = (['apple', 'banana'], [3, 1])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, 'test_word_count.txt')
+            wc.write_results(output_file, columns, 4, 0.123)
+
+            with open(output_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        assert "Total distinct words: 2" in content
+        assert "Total words:          4" in content
+
+    def test_write_results_decodes_bytes_keys(self):
+        """Test that ASCII-path bytes words are written as text"""
+        sorted_freq = [(b'apple', 3), (b'banana', 1)]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, 'test_word_count.txt')
+            wc.write_results(output_file, sorted_freq, 4, 0.123)
+
+            with open(output_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        assert "apple" in content
+        assert "b'apple'" not in content
+
+
 class TestEndToEnd:
     """End-to-end tests"""
 